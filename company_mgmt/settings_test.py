@@ -0,0 +1,37 @@
+"""
+Django test settings for company_mgmt project.
+
+Extends the development settings with faster defaults for the test suite.
+Run the tests with::
+
+    python manage.py test management.tests --settings=company_mgmt.settings_test
+"""
+
+import copy
+
+from .settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Keep only the middleware the views and the admin system checks rely on
+MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+]
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# The cached template loader is already the default; only drop template debug
+# info. Copy first so the imported development TEMPLATES stay untouched
+TEMPLATES = copy.deepcopy(TEMPLATES)
+TEMPLATES[0]['OPTIONS']['debug'] = False
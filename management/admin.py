@@ -4,11 +4,25 @@ from .models import Company, Unit, Employee
 @admin.register(Company)
 class CompanyAdmin(admin.ModelAdmin):
     list_display = ('name', 'address')
+    search_fields = ('name',)
+    ordering = ('name',)
 
 @admin.register(Unit)
 class UnitAdmin(admin.ModelAdmin):
     list_display = ('name', 'company')
+    list_select_related = ('company',)
+    search_fields = ('name',)
+    ordering = ('name',)
+    autocomplete_fields = ('company',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('company')
 
 @admin.register(Employee)
 class EmployeeAdmin(admin.ModelAdmin):
     list_display = ('first_name', 'last_name', 'email', 'unit')
+    list_select_related = ('unit',)
+    autocomplete_fields = ('unit',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('unit')
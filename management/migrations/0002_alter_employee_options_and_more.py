@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='employee',
+            options={'ordering': ['last_name', 'first_name']},
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['unit', 'last_name'], name='management__unit_id_cb2de9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['last_name', 'first_name'], name='management__last_na_9e9dd0_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.15 on 2026-10-15 22:05
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_company_name(apps, schema_editor):
+    Company = apps.get_model('management', 'Company')
+    Unit = apps.get_model('management', 'Unit')
+    Unit.objects.update(
+        company_name=Subquery(
+            Company.objects.filter(pk=OuterRef('company_id')).values('name')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0002_alter_employee_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='unit',
+            name='company_name',
+            field=models.CharField(default='', editable=False, max_length=255),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_company_name, migrations.RunPython.noop),
+    ]
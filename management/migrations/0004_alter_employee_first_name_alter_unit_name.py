@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0003_unit_company_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='employee',
+            name='first_name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='unit',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
@@ -4,23 +4,49 @@ class Company(models.Model):
     name = models.CharField(max_length=255, unique=True)
     address = models.TextField(blank=True, null=True)
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        update_fields = kwargs.get('update_fields')
+        super().save(*args, **kwargs)
+        # Keep the denormalized name on child units in sync; a new company has none
+        if not adding and (update_fields is None or 'name' in update_fields):
+            self.units.exclude(company_name=self.name).update(company_name=self.name)
+
     def __str__(self):
         return self.name
 
 
 class Unit(models.Model):
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='units')
+    company_name = models.CharField(max_length=255, editable=False)
+
+    def save(self, *args, **kwargs):
+        # Only resolve the company when company_name is actually written
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.company_name = self.company.name
+        elif {'company', 'company_id', 'company_name'} & set(update_fields):
+            self.company_name = self.company.name
+            kwargs['update_fields'] = {*update_fields, 'company_name'}
+        super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"{self.name} ({self.company.name})"
+        return f"{self.name} ({self.company_name})"
 
 
 class Employee(models.Model):
-    first_name = models.CharField(max_length=255)
+    first_name = models.CharField(max_length=255, db_index=True)
     last_name = models.CharField(max_length=255)
     email = models.EmailField(unique=True)
     unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='employees')
 
+    class Meta:
+        ordering = ['last_name', 'first_name']
+        indexes = [
+            models.Index(fields=['unit', 'last_name']),
+            models.Index(fields=['last_name', 'first_name']),
+        ]
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -0,0 +1,11 @@
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Company, Unit, Employee
+
+@receiver([post_save, post_delete], sender=Company)
+@receiver([post_save, post_delete], sender=Unit)
+@receiver([post_save, post_delete], sender=Employee)
+def clear_list_cache(sender, **kwargs):
+    # Unit and employee lists show parent names, so any change can affect any list
+    caches['lists'].clear()
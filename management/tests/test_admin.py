@@ -0,0 +1,154 @@
+"""
+Admin Test Module.
+
+This module contains tests for the management admin pages.
+It follows PEP 8 and PEP 287 standards.
+
+Classes:
+    AdminAutocompleteTests: Test cases for the admin autocomplete endpoints.
+    AdminChangelistTests: Test cases for the admin changelist pages.
+
+Test Cases:
+    - Autocomplete ordering
+    - Autocomplete pagination
+    - Changelist query counts
+"""
+
+import warnings
+
+from django.contrib.auth.models import User
+from django.core.paginator import UnorderedObjectListWarning
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from management.models import Company, Unit, Employee
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class AdminAutocompleteTests(TestCase):
+    """Test cases for the admin autocomplete endpoints.
+
+    Attributes:
+        user: A test superuser instance.
+        company_names: Names of the test companies, in sorted order.
+        unit_names: Names of the test units, in sorted order.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """Set up non-modified objects used by all test methods"""
+        cls.user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='testpassword'
+        )
+        # More rows than one autocomplete page, created out of name order
+        cls.company_names = sorted(f'Company {i:02d}' for i in range(25))
+        companies = Company.objects.bulk_create([
+            Company(name=name) for name in reversed(cls.company_names)
+        ])
+        cls.unit_names = sorted(f'Unit {i:02d}' for i in range(25))
+        Unit.objects.bulk_create([
+            Unit(name=name, company=companies[0], company_name=companies[0].name)
+            for name in reversed(cls.unit_names)
+        ])
+
+    def setUp(self):
+        """Set up test case specific data"""
+        self.client.force_login(self.user)
+
+    def get_autocomplete_labels(self, model_name, field_name):
+        """Collect every autocomplete result label, page by page"""
+        labels = []
+        page = 1
+        while True:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', UnorderedObjectListWarning)
+                response = self.client.get(reverse('admin:autocomplete'), {
+                    'app_label': 'management',
+                    'model_name': model_name,
+                    'field_name': field_name,
+                    'page': page,
+                })
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            labels += [result['text'] for result in data['results']]
+            if not data['pagination']['more']:
+                return labels
+            page += 1
+
+    def test_company_autocomplete_ordered(self):
+        """Test that the unit form's company autocomplete pages through companies by name"""
+        labels = self.get_autocomplete_labels('unit', 'company')
+        self.assertEqual(labels, self.company_names)
+
+    def test_unit_autocomplete_ordered(self):
+        """Test that the employee form's unit autocomplete pages through units by name"""
+        labels = self.get_autocomplete_labels('employee', 'unit')
+        self.assertEqual(labels, [f'{name} (Company 24)' for name in self.unit_names])
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class AdminChangelistTests(TestCase):
+    """Test cases for the admin changelist pages.
+
+    Attributes:
+        user: A test superuser instance.
+        company: A test company instance.
+        unit: A test unit instance.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """Set up non-modified objects used by all test methods"""
+        cls.user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='testpassword'
+        )
+        cls.company = Company.objects.create(name='Test Company')
+        cls.unit = Unit.objects.create(name='Test Unit', company=cls.company)
+        Employee.objects.create(
+            first_name='Test',
+            last_name='Employee',
+            email='test.employee@example.com',
+            unit=cls.unit
+        )
+
+    def setUp(self):
+        """Set up test case specific data"""
+        self.client.force_login(self.user)
+
+    def add_rows(self, count):
+        """Add ``count`` units, each under its own company and with one employee"""
+        companies = Company.objects.bulk_create([
+            Company(name=f'Company {i}') for i in range(count)
+        ])
+        units = Unit.objects.bulk_create([
+            Unit(name=f'Unit {i}', company=company, company_name=company.name)
+            for i, company in enumerate(companies)
+        ])
+        Employee.objects.bulk_create([
+            Employee(
+                first_name=f'First {i}',
+                last_name=f'Last {i}',
+                email=f'employee{i}@example.com',
+                unit=unit
+            )
+            for i, unit in enumerate(units)
+        ])
+
+    def test_changelist_query_count_constant(self):
+        """Test that the changelist query counts do not grow with the number of rows"""
+        urls = [
+            reverse('admin:management_unit_changelist'),
+            reverse('admin:management_employee_changelist'),
+        ]
+        baseline = {}
+        for url in urls:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            baseline[url] = len(queries)
+        self.add_rows(20)
+        for url in urls:
+            with self.subTest(url=url), self.assertNumQueries(baseline[url]):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
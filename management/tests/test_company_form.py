@@ -15,35 +15,22 @@ Test Categories:
     - Mixed script handling
 """
 
-from django.test import TestCase
-from django.urls import reverse
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import resolve, reverse, reverse_lazy
 from django.contrib.auth.models import User
-from management.models import Company
+from management.forms import CompanyForm
+from management.models import Company, Unit
 
-class CompanyFormViewTests(TestCase):
-    """Test cases for company form views.
+class CompanyFormGetTests(SimpleTestCase):
+    """Test cases for rendering the empty company creation form.
 
-    This class contains test methods for verifying company form functionality,
-    including form rendering, validation, and special character handling.
+    The creation form has no foreign keys and the view does not require a
+    login, so these requests never touch the database.
 
     Attributes:
-        user: A test user instance.
-        company: A test company instance.
         url_create: URL for company creation.
-        url_edit: URL for company editing.
     """
-    def setUp(self):
-        """Set up test data"""
-        # Create a user
-        self.user = User.objects.create_user(username='testuser', password='testpassword')
-        self.client.login(username='testuser', password='testpassword')
-
-        # Create a company
-        self.company = Company.objects.create(name='Test Company', address='123 Test St')
-        
-        # Set up URLs
-        self.url_create = reverse('company_create')
-        self.url_edit = reverse('company_edit', args=[self.company.pk])
+    url_create = reverse_lazy('company_create')
 
     def test_company_form_view_status_code(self):
         """Test that the company form view returns a 200 status code."""
@@ -60,16 +47,53 @@ class CompanyFormViewTests(TestCase):
         response = self.client.get(self.url_create)
         self.assertIn('form', response.context)
 
-    def test_company_form_view_edit_company(self):
-        """Test that the form view displays the correct header for editing."""
-        response = self.client.get(self.url_edit)
-        self.assertContains(response, 'Edit Company')
-
     def test_company_form_view_new_company(self):
         """Test that the form view displays the correct header for creation."""
         response = self.client.get(self.url_create)
         self.assertContains(response, 'New Company')
 
+    def test_company_form_view_name(self):
+        """Test that the company form view is named after its model."""
+        view = resolve(self.url_create).func
+        self.assertEqual(view.__name__, 'company_edit')
+        self.assertEqual(view.__qualname__, 'company_edit')
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class CompanyFormViewTests(TestCase):
+    """Test cases for company form views.
+
+    This class contains test methods for verifying company form functionality,
+    including form rendering, validation, and special character handling.
+
+    Attributes:
+        user: A test user instance.
+        company: A test company instance.
+        url_create: URL for company creation.
+        url_edit: URL for company editing.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """Set up non-modified objects used by all test methods"""
+        # Create a user
+        cls.user = User.objects.create_user(username='testuser', password='testpassword')
+
+        # Create a company
+        cls.company = Company.objects.create(name='Test Company', address='123 Test St')
+
+        # Set up URLs
+        cls.url_create = reverse('company_create')
+        cls.url_edit = reverse('company_edit', args=[cls.company.pk])
+
+    def setUp(self):
+        """Set up test case specific data"""
+        self.client.force_login(self.user)
+
+    def test_company_form_view_edit_company(self):
+        """Test that the form view displays the correct header for editing."""
+        response = self.client.get(self.url_edit)
+        self.assertContains(response, 'Edit Company')
+
     def test_special_case_invalid_form(self):
         """Test the special case where the form is invalid."""
         response = self.client.post(self.url_create, {
@@ -77,7 +101,7 @@ class CompanyFormViewTests(TestCase):
             'address': ''
         })
         self.assertEqual(response.status_code, 200)  # Form should return to same page
-        self.assertContains(response, 'This field is required')
+        self.assertIn('name', response.context['form'].errors)
 
     def test_special_case_long_names(self):
         """Test the special case where company names are very long."""
@@ -89,26 +113,6 @@ class CompanyFormViewTests(TestCase):
         self.assertEqual(response.status_code, 302)  # Should redirect on success
         self.assertTrue(Company.objects.filter(name=long_name).exists())
 
-    def test_special_case_special_characters(self):
-        """Test the special case where company names contain special characters."""
-        special_name = 'Tëst Cømpåñy'
-        response = self.client.post(self.url_create, {
-            'name': special_name,
-            'address': '123 Test St'
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Company.objects.filter(name=special_name).exists())
-
-    def test_special_case_chinese_characters(self):
-        """Test the special case where company names contain Chinese characters."""
-        chinese_name = '测试公司'
-        response = self.client.post(self.url_create, {
-            'name': chinese_name,
-            'address': '123 Test St'
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Company.objects.filter(name=chinese_name).exists())
-
     def test_successful_company_creation(self):
         """Test successful company creation."""
         response = self.client.post(self.url_create, {
@@ -128,6 +132,28 @@ class CompanyFormViewTests(TestCase):
         self.company.refresh_from_db()
         self.assertEqual(self.company.name, 'Updated Company')
 
+    def test_company_rename_updates_unit_labels(self):
+        """Test that renaming a company updates the labels of its units."""
+        unit = Unit.objects.create(name='HR', company=self.company)
+        response = self.client.post(self.url_edit, {
+            'name': 'Renamed Company',
+            'address': '123 Test St'
+        })
+        self.assertEqual(response.status_code, 302)  # Should redirect on success
+        unit.refresh_from_db()
+        self.assertEqual(str(unit), 'HR (Renamed Company)')
+
+    def test_company_address_update_skips_unit_sync(self):
+        """Test that saving only the address does not touch the company's units."""
+        self.company.address = '456 Other St'
+        with self.assertNumQueries(1):
+            self.company.save(update_fields=['address'])
+
+    def test_new_company_skips_unit_sync(self):
+        """Test that creating a company does not try to update its (absent) units."""
+        with self.assertNumQueries(1):
+            Company.objects.create(name='Brand New Company')
+
     def test_special_case_extremely_long_string(self):
         """Test handling of extremely long company names."""
         very_long_name = 'A' * 1000  # Test with 1000 characters
@@ -136,56 +162,77 @@ class CompanyFormViewTests(TestCase):
             'address': '123 Test St'
         })
         self.assertEqual(response.status_code, 200)  # Should stay on form
-        self.assertContains(response, 'Ensure this value has at most')
+        self.assertIn('name', response.context['form'].errors)
+
+
+class CompanyFormTests(TestCase):
+    """Test cases for the company form itself.
+
+    These tests validate and save :class:`CompanyForm` directly instead of
+    posting through the view, so they need no user or session.
+    """
+    def test_special_case_special_characters(self):
+        """Test the special case where company names contain special characters."""
+        special_name = 'Tëst Cømpåñy'
+        form = CompanyForm(data={
+            'name': special_name,
+            'address': '123 Test St'
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().name, special_name)
+
+    def test_special_case_chinese_characters(self):
+        """Test the special case where company names contain Chinese characters."""
+        chinese_name = '测试公司'
+        form = CompanyForm(data={
+            'name': chinese_name,
+            'address': '123 Test St'
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().name, chinese_name)
 
     def test_special_case_arabic_text(self):
         """Test handling of Arabic company names and addresses."""
         arabic_name = 'شركة الاختبار'  # Test Company in Arabic
         arabic_address = 'شارع الاختبار ١٢٣'  # Test Street 123 in Arabic
-        response = self.client.post(self.url_create, {
+        form = CompanyForm(data={
             'name': arabic_name,
             'address': arabic_address
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(
-            Company.objects.filter(
-                name=arabic_name,
-                address=arabic_address
-            ).exists()
-        )
+        self.assertTrue(form.is_valid(), form.errors)
+        company = form.save()
+        self.assertEqual(company.name, arabic_name)
+        self.assertEqual(company.address, arabic_address)
 
     def test_special_case_infinity_values(self):
         """Test handling of infinity symbols in company names."""
         infinity_name = '∞ Company'
-        response = self.client.post(self.url_create, {
+        form = CompanyForm(data={
             'name': infinity_name,
             'address': '123 ∞ Street'
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Company.objects.filter(name=infinity_name).exists())
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().name, infinity_name)
 
     def test_special_case_negative_infinity(self):
         """Test handling of negative infinity symbols in company names."""
         neg_infinity_name = '-∞ Corporation'
-        response = self.client.post(self.url_create, {
+        form = CompanyForm(data={
             'name': neg_infinity_name,
             'address': '123 -∞ Avenue'
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Company.objects.filter(name=neg_infinity_name).exists())
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().name, neg_infinity_name)
 
     def test_mixed_scripts_and_numbers(self):
         """Test handling of mixed scripts with numbers."""
         mixed_name = 'Company∞ - شركة - 公司'
         mixed_address = '123 Test St, شارع ١٢٣, 测试街123'
-        response = self.client.post(self.url_create, {
+        form = CompanyForm(data={
             'name': mixed_name,
             'address': mixed_address
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(
-            Company.objects.filter(
-                name=mixed_name,
-                address=mixed_address
-            ).exists()
-        )
\ No newline at end of file
+        self.assertTrue(form.is_valid(), form.errors)
+        company = form.save()
+        self.assertEqual(company.name, mixed_name)
+        self.assertEqual(company.address, mixed_address)
@@ -13,11 +13,13 @@ Test Categories:
     - Numeric edge cases
 """
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
+from management.forms import EmployeeForm
 from management.models import Employee, Unit, Company
 
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class EmployeeFormViewTests(TestCase):
     """Test cases for employee form views.
 
@@ -32,38 +34,42 @@ class EmployeeFormViewTests(TestCase):
         url_create: URL for employee creation.
         url_edit: URL for employee editing.
     """
-    def setUp(self):
-        """Set up test data for all test methods"""
+    @classmethod
+    def setUpTestData(cls):
+        """Set up non-modified objects used by all test methods"""
         # Create a user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpassword'
         )
-        self.client.login(username='testuser', password='testpassword')
 
         # Create a company first
-        self.company = Company.objects.create(
+        cls.company = Company.objects.create(
             name='Test Company',
             address='123 Test St'
         )
 
         # Create a unit with company reference
-        self.unit = Unit.objects.create(
+        cls.unit = Unit.objects.create(
             name='HR',
-            company=self.company
+            company=cls.company
         )
 
         # Create an employee
-        self.employee = Employee.objects.create(
+        cls.employee = Employee.objects.create(
             first_name='John',
             last_name='Doe',
             email='john.doe@example.com',
-            unit=self.unit
+            unit=cls.unit
         )
 
         # Set up URLs
-        self.url_create = reverse('employee_create')
-        self.url_edit = reverse('employee_edit', args=[self.employee.pk])
+        cls.url_create = reverse('employee_create')
+        cls.url_edit = reverse('employee_edit', args=[cls.employee.pk])
+
+    def setUp(self):
+        """Set up test case specific data"""
+        self.client.force_login(self.user)
 
     def test_employee_form_view_status_code(self):
         """Test that the employee form view returns a 200 status code"""
@@ -99,8 +105,10 @@ class EmployeeFormViewTests(TestCase):
             'unit': self.unit.pk
         })
         self.assertEqual(response.status_code, 200)  # Form should return to same page
-        self.assertContains(response, 'This field is required')  # Check error message in response
-        self.assertContains(response, 'Enter a valid email address')
+        errors = response.context['form'].errors
+        self.assertIn('first_name', errors)
+        self.assertIn('last_name', errors)
+        self.assertIn('email', errors)
 
     def test_special_case_long_names(self):
         """Test the special case where employee names are very long"""
@@ -119,55 +127,6 @@ class EmployeeFormViewTests(TestCase):
             ).exists()
         )
 
-    def test_special_case_special_characters(self):
-        """Test the special case where names contain special characters"""
-        special_name = 'Tëst Nämë'
-        response = self.client.post(self.url_create, {
-            'first_name': special_name,
-            'last_name': special_name,
-            'email': 'special.name@example.com',
-            'unit': self.unit.pk
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(
-            Employee.objects.filter(
-                first_name=special_name,
-                last_name=special_name
-            ).exists()
-        )
-
-    def test_special_case_chinese_characters(self):
-        """Test the special case where names contain Chinese characters"""
-        chinese_name = '张伟'
-        response = self.client.post(self.url_create, {
-            'first_name': chinese_name,
-            'last_name': '李',
-            'email': 'chinese.test@example.com',
-            'unit': self.unit.pk
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(
-            Employee.objects.filter(
-                first_name=chinese_name
-            ).exists()
-        )
-
-    def test_special_case_japanese_characters(self):
-        """Test the special case where names contain Japanese characters"""
-        japanese_name = '田中太郎'
-        response = self.client.post(self.url_create, {
-            'first_name': japanese_name,
-            'last_name': '山田花子',
-            'email': 'japanese.test@example.com',
-            'unit': self.unit.pk
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(
-            Employee.objects.filter(
-                first_name=japanese_name
-            ).exists()
-        )
-
     def test_special_case_extremely_long_names(self):
         """Test handling of extremely long names (edge case)."""
         very_long_name = 'A' * 1000  # Test with 1000 characters
@@ -178,54 +137,60 @@ class EmployeeFormViewTests(TestCase):
             'unit': self.unit.pk
         })
         self.assertEqual(response.status_code, 200)  # Should stay on form
-        self.assertContains(response, 'Ensure this value has at most')
+        self.assertIn('first_name', response.context['form'].errors)
 
-    def test_special_case_arabic_names(self):
-        """Test handling of Arabic names and characters."""
-        arabic_first_name = 'محمد'  # Mohammed
-        arabic_last_name = 'العربي'  # Al-Arabi
-        response = self.client.post(self.url_create, {
-            'first_name': arabic_first_name,
-            'last_name': arabic_last_name,
-            'email': 'arabic.test@example.com',
-            'unit': self.unit.pk
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(
-            Employee.objects.filter(
-                first_name=arabic_first_name,
-                last_name=arabic_last_name
-            ).exists()
-        )
 
-    def test_special_case_infinity_values(self):
-        """Test handling of infinity symbols in names."""
-        infinity_name = '∞ Employee'
-        response = self.client.post(self.url_create, {
-            'first_name': infinity_name,
-            'last_name': '-∞ Test',
-            'email': 'infinity.test@example.com',
-            'unit': self.unit.pk
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(
-            Employee.objects.filter(
-                first_name=infinity_name
-            ).exists()
+class EmployeeFormTests(TestCase):
+    """Test cases for the employee form itself.
+
+    These tests validate and save :class:`EmployeeForm` directly instead of
+    posting through the view, so they need no user or session.
+
+    Attributes:
+        company: A test company instance.
+        unit: A test unit instance.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """Set up non-modified objects used by all test methods"""
+        cls.company = Company.objects.create(
+            name='Test Company',
+            address='123 Test St'
+        )
+        cls.unit = Unit.objects.create(
+            name='HR',
+            company=cls.company
         )
 
-    def test_mixed_scripts_and_numbers(self):
-        """Test handling of mixed scripts with numbers."""
-        mixed_name = 'Employee∞ - موظف - 職員'
-        response = self.client.post(self.url_create, {
-            'first_name': mixed_name,
-            'last_name': '123测试',
-            'email': 'mixed.test@example.com',
-            'unit': self.unit.pk
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(
-            Employee.objects.filter(
-                first_name=mixed_name
-            ).exists()
-        )
\ No newline at end of file
+    def test_unicode_names(self):
+        """Test handling of special characters, non-Latin scripts and symbols in names."""
+        cases = {
+            'special_characters': ('Tëst Nämë', 'Tëst Nämë'),
+            'chinese': ('张伟', '李'),
+            'japanese': ('田中太郎', '山田花子'),
+            'arabic': ('محمد', 'العربي'),  # Mohammed Al-Arabi
+            'infinity': ('∞ Employee', '-∞ Test'),
+            'mixed_scripts': ('Employee∞ - موظف - 職員', '123测试'),
+        }
+        for case, (first_name, last_name) in cases.items():
+            with self.subTest(case=case):
+                form = EmployeeForm(data={
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'email': f'{case}.test@example.com',
+                    'unit': self.unit.pk
+                })
+                self.assertTrue(form.is_valid(), form.errors)
+                employee = form.save()
+                self.assertEqual(employee.first_name, first_name)
+                self.assertEqual(employee.last_name, last_name)
+
+    def test_unit_choices_rendered_in_single_query(self):
+        """Test that unit choices and their company names load in one query."""
+        Unit.objects.bulk_create([
+            Unit(name=f'Unit {i}', company=self.company, company_name=self.company.name)
+            for i in range(50)
+        ])
+        form = EmployeeForm()
+        with self.assertNumQueries(1):
+            str(form['unit'])
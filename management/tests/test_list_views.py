@@ -0,0 +1,112 @@
+"""
+List View Test Module.
+
+This module contains tests for the company, unit and employee list views.
+It follows PEP 8 and PEP 287 standards.
+
+Classes:
+    ListViewTests: Test cases for the list views.
+
+Test Cases:
+    - Template usage
+    - Query counts independent of the number of rows
+    - Pagination
+    - Response caching and invalidation
+"""
+
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.cache import get_max_age
+from management.models import Company, Employee, Unit
+from management.views import PAGE_SIZE
+
+class ListViewTests(TestCase):
+    """Test cases for the list views.
+
+    Attributes:
+        company: A test company instance.
+        units: Test unit instances belonging to ``company``.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """Set up non-modified objects used by all test methods"""
+        cls.company = Company.objects.create(
+            name='Test Company',
+            address='123 Test St'
+        )
+        cls.units = Unit.objects.bulk_create([
+            Unit(name=f'Unit {i}', company=cls.company, company_name=cls.company.name)
+            for i in range(5)
+        ])
+        Employee.objects.bulk_create([
+            Employee(
+                first_name='Test',
+                last_name=f'Employee {i}',
+                email=f'employee{i}@example.com',
+                unit=cls.units[i % len(cls.units)]
+            )
+            for i in range(10)
+        ])
+
+    def setUp(self):
+        """Start every test with an empty list page cache"""
+        caches['lists'].clear()
+
+    def test_company_list(self):
+        """Test that the company list renders with a count query and a single page query"""
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('company_list'))
+        self.assertTemplateUsed(response, 'management/companies.html')
+        self.assertContains(response, 'Test Company')
+
+    def test_unit_list(self):
+        """Test that the unit list shows each unit's company name without extra queries"""
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('unit_list'))
+        self.assertTemplateUsed(response, 'management/units.html')
+        self.assertContains(response, 'Unit 4')
+        self.assertContains(response, 'Test Company')
+
+    def test_employee_list(self):
+        """Test that the employee list loads each employee's unit in the page query"""
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('employee_list'))
+        self.assertTemplateUsed(response, 'management/employees.html')
+        self.assertContains(response, 'Employee 9')
+
+    def test_unit_list_paginated(self):
+        """Test that the unit list shows at most one page of units"""
+        Unit.objects.bulk_create([
+            Unit(name=f'Extra Unit {i}', company=self.company, company_name=self.company.name)
+            for i in range(PAGE_SIZE)
+        ])
+        response = self.client.get(reverse('unit_list'))
+        self.assertEqual(len(response.context['page_obj']), PAGE_SIZE)
+        self.assertContains(response, '?page=2')
+
+        response = self.client.get(reverse('unit_list'), {'page': 2})
+        self.assertEqual(len(response.context['page_obj']), len(self.units))
+
+    def test_unit_list_cached(self):
+        """Test that a repeated unit list request is served from the cache"""
+        self.client.get(reverse('unit_list'))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('unit_list'))
+        self.assertContains(response, 'Unit 4')
+
+    def test_list_pages_not_cached_by_browser(self):
+        """Test that cached list pages tell the browser not to keep its own copy"""
+        for name in ('company_list', 'unit_list', 'employee_list'):
+            with self.subTest(view=name):
+                for _ in range(2):  # Fresh render, then a server cache hit
+                    response = self.client.get(reverse(name))
+                    self.assertEqual(get_max_age(response), 0)
+                    self.assertIn('no-store', response['Cache-Control'])
+
+    def test_unit_list_cache_cleared_on_save(self):
+        """Test that saving a unit clears the cached unit list"""
+        self.client.get(reverse('unit_list'))
+        Unit.objects.create(name='New Unit', company=self.company)
+        response = self.client.get(reverse('unit_list'))
+        self.assertContains(response, 'New Unit')
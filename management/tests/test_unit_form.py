@@ -5,7 +5,10 @@ This module contains tests for the unit form functionality.
 It follows PEP 8 and PEP 287 standards.
 
 Classes:
-    UnitFormViewTests: Test cases for unit form views.
+    UnitFormTestCase: Shared fixtures for unit form view tests.
+    UnitFormViewTests: Test cases for the unit creation view.
+    UnitFormEditTests: Test cases for the unit edit view.
+    UnitFormTests: Test cases for the unit form itself.
 
 Test Cases:
     - Basic form functionality
@@ -15,35 +18,27 @@ Test Cases:
     - CRUD operations
 """
 
-from django.test import TestCase, Client
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
+from management.forms import UnitForm
 from management.models import Unit, Company
 
-class UnitFormViewTests(TestCase):
-    """Test cases for unit form views.
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class UnitFormTestCase(TestCase):
+    """Shared fixtures for unit form view tests.
 
-    This class contains test methods for verifying unit form functionality,
-    including form rendering, validation, and special character handling.
+    Creates the user and company every unit form test needs and logs the
+    user in. Holds no tests of its own.
 
     Attributes:
         user: A test user instance.
         company: A test company instance.
-        unit: A test unit instance.
         url_create: URL for unit creation.
-        url_edit: URL for unit editing.
-
-    Test Categories:
-        - Basic form operations
-        - Unicode character support
-        - Edge cases
-        - Form validation
-        - Database integrity
     """
     @classmethod
     def setUpTestData(cls):
         """Set up non-modified objects used by all test methods"""
-        cls.client = Client()
         # Create test user
         cls.user = User.objects.create_user(
             username='testuser',
@@ -54,53 +49,36 @@ class UnitFormViewTests(TestCase):
             name='Test Company',
             address='123 Test St'
         )
-        # Create unit with company reference
-        cls.unit = Unit.objects.create(
-            name='HR',
-            company=cls.company
-        )
         # Set up URLs
         cls.url_create = reverse('unit_create')
-        cls.url_edit = reverse('unit_edit', args=[cls.unit.pk])
 
     def setUp(self):
         """Set up test case specific data"""
-        self.client.login(username='testuser', password='testpassword')
+        self.client.force_login(self.user)
 
-    def test_unit_form_view_status_code(self):
-        """Test that the unit form view returns a 200 status code"""
-        response = self.client.get(self.url_create)
-        self.assertEqual(response.status_code, 200)
-
-    def test_unit_form_view_template_used(self):
-        """Test that the unit form view uses the correct template"""
-        response = self.client.get(self.url_create)
-        self.assertTemplateUsed(response, 'management/unit_form.html')
 
-    def test_unit_form_view_context(self):
-        """Test that the unit form view provides the correct context data"""
-        response = self.client.get(self.url_create)
-        self.assertIn('form', response.context)
+class UnitFormViewTests(UnitFormTestCase):
+    """Test cases for the unit creation view.
 
-    def test_unit_form_view_edit_unit(self):
-        """Test that the unit form view displays the correct header for editing a unit"""
-        response = self.client.get(self.url_edit)
-        self.assertContains(response, 'Edit Unit')
+    This class contains test methods for verifying unit form functionality,
+    including form rendering, validation, and special character handling.
+    These tests need no pre-existing unit.
 
-    def test_unit_form_view_new_unit(self):
-        """Test that the unit form view displays the correct header for creating a new unit"""
+    Test Categories:
+        - Basic form operations
+        - Unicode character support
+        - Edge cases
+        - Form validation
+        - Database integrity
+    """
+    def test_unit_form_view_create_get(self):
+        """Test that the unit creation form renders with the correct template, context and header"""
         response = self.client.get(self.url_create)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'management/unit_form.html')
+        self.assertIn('form', response.context)
         self.assertContains(response, 'New Unit')
 
-    def test_special_case_invalid_form(self):
-        """Test the special case where the form is invalid"""
-        response = self.client.post(self.url_create, {
-            'name': '',
-            'company': self.company.pk
-        })
-        self.assertEqual(response.status_code, 200)  # Form should return to the same page
-        self.assertContains(response, 'This field is required')
-
     def test_special_case_long_names(self):
         """Test the special case where unit names are very long"""
         # Adjust length based on your model's max_length
@@ -109,37 +87,70 @@ class UnitFormViewTests(TestCase):
             'name': long_name,
             'company': self.company.pk
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Unit.objects.filter(name=long_name).exists())
+        self.assertRedirects(response, reverse('unit_list'), fetch_redirect_response=False)
+        self.assertEqual(Unit.objects.latest('pk').name, long_name)
 
-    def test_special_case_special_characters(self):
-        """Test the special case where unit names contain special characters"""
-        special_name = 'Tëst Ünît'
+    def test_unit_form_view_successful_creation(self):
+        """Test successful unit creation"""
         response = self.client.post(self.url_create, {
-            'name': special_name,
+            'name': 'New Unit',
             'company': self.company.pk
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Unit.objects.filter(name=special_name).exists())
+        self.assertRedirects(response, reverse('unit_list'), fetch_redirect_response=False)
+        self.assertEqual(Unit.objects.latest('pk').name, 'New Unit')
 
-    def test_special_case_chinese_characters(self):
-        """Test the special case where unit names contain Chinese characters"""
-        chinese_name = '测试单位'
+    def test_unit_form_view_empty_name(self):
+        """Test that posting an empty name re-renders the form with a name error"""
         response = self.client.post(self.url_create, {
-            'name': chinese_name,
+            'name': '',
             'company': self.company.pk
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Unit.objects.filter(name=chinese_name).exists())
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('name', response.context['form'].errors)
+        self.assertFalse(Unit.objects.exists())
+
+    def test_unicode_names_accepted(self):
+        """Test that unit names with special characters, non-Latin scripts and symbols are saved."""
+        names = [
+            'Tëst Ünît',
+            '测试单位',
+            'قسم الموارد البشرية',  # Human Resources Department in Arabic
+            'HR部門 - قسم 人力资源',  # HR Department in multiple scripts
+            '∞ Department',
+            '-∞ Division',
+        ]
+        for name in names:
+            with self.subTest(name=name):
+                response = self.client.post(self.url_create, {
+                    'name': name,
+                    'company': self.company.pk
+                })
+                self.assertRedirects(response, reverse('unit_list'), fetch_redirect_response=False)
+                self.assertEqual(Unit.objects.latest('pk').name, name)
+
+
+class UnitFormEditTests(UnitFormTestCase):
+    """Test cases for the unit edit view.
 
-    def test_unit_form_view_successful_creation(self):
-        """Test successful unit creation"""
-        response = self.client.post(self.url_create, {
-            'name': 'New Unit',
-            'company': self.company.pk
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Unit.objects.filter(name='New Unit').exists())
+    Attributes:
+        unit: A test unit instance.
+        url_edit: URL for unit editing.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the unit being edited on top of the shared fixtures"""
+        super().setUpTestData()
+        # Create unit with company reference
+        cls.unit = Unit.objects.create(
+            name='HR',
+            company=cls.company
+        )
+        cls.url_edit = reverse('unit_edit', args=[cls.unit.pk])
+
+    def test_unit_form_view_edit_unit(self):
+        """Test that the unit form view displays the correct header for editing a unit"""
+        response = self.client.get(self.url_edit)
+        self.assertContains(response, 'Edit Unit')
 
     def test_unit_form_view_successful_edit(self):
         """Test successful unit edit"""
@@ -147,56 +158,60 @@ class UnitFormViewTests(TestCase):
             'name': 'Updated HR',
             'company': self.company.pk
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
+        self.assertRedirects(response, reverse('unit_list'), fetch_redirect_response=False)
         self.unit.refresh_from_db()
         self.assertEqual(self.unit.name, 'Updated HR')
 
-    def test_special_case_very_long_string(self):
-        """Test the special case where unit names are extremely long."""
-        very_long_name = 'A' * 1000  # Try with 1000 characters
-        response = self.client.post(self.url_create, {
-            'name': very_long_name,
-            'company': self.company.pk
-        })
-        self.assertEqual(response.status_code, 200)  # Should return to form
-        self.assertContains(response, 'Ensure this value has at most')
+    def test_unit_company_change_with_update_fields(self):
+        """Test that saving only the company still updates the unit's company name"""
+        for field in ('company', 'company_id'):
+            with self.subTest(update_fields=field):
+                other_company = Company.objects.create(name=f'Other Company {field}')
+                self.unit.company_id = other_company.pk
+                self.unit.save(update_fields=[field])
+                self.unit.refresh_from_db()
+                self.assertEqual(self.unit.company_name, other_company.name)
 
-    def test_special_case_infinity(self):
-        """Test the special case where unit names contain infinity symbols."""
-        infinity_name = '∞ Department'  # Unicode infinity symbol
-        response = self.client.post(self.url_create, {
-            'name': infinity_name,
-            'company': self.company.pk
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Unit.objects.filter(name=infinity_name).exists())
+    def test_unit_name_update_skips_company_lookup(self):
+        """Test that saving only the unit name does not load the company"""
+        unit = Unit.objects.get(pk=self.unit.pk)
+        unit.name = 'Renamed HR'
+        with self.assertNumQueries(1):
+            unit.save(update_fields=['name'])
 
-    def test_special_case_negative_infinity(self):
-        """Test the special case where unit names contain negative infinity symbols."""
-        neg_infinity_name = '-∞ Division'  # Negative infinity
-        response = self.client.post(self.url_create, {
-            'name': neg_infinity_name,
-            'company': self.company.pk
-        })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Unit.objects.filter(name=neg_infinity_name).exists())
 
-    def test_special_case_arabic_characters(self):
-        """Test the special case where unit names contain Arabic characters."""
-        arabic_name = 'قسم الموارد البشرية'  # Human Resources Department in Arabic
-        response = self.client.post(self.url_create, {
-            'name': arabic_name,
+class UnitFormTests(TestCase):
+    """Test cases for the unit form itself.
+
+    These tests validate :class:`UnitForm` directly instead of posting
+    through the view, so they need no user or session.
+
+    Attributes:
+        company: A test company instance.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """Set up non-modified objects used by all test methods"""
+        cls.company = Company.objects.create(
+            name='Test Company',
+            address='123 Test St'
+        )
+
+    def test_special_case_invalid_form(self):
+        """Test the special case where the form is invalid"""
+        form = UnitForm(data={
+            'name': '',
             'company': self.company.pk
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Unit.objects.filter(name=arabic_name).exists())
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors['name'], ['This field is required.'])
 
-    def test_special_case_mixed_scripts(self):
-        """Test the special case where unit names contain mixed scripts."""
-        mixed_name = 'HR部門 - قسم 人力资源'  # HR Department in multiple scripts
-        response = self.client.post(self.url_create, {
-            'name': mixed_name,
+    def test_special_case_very_long_string(self):
+        """Test the special case where unit names are extremely long."""
+        very_long_name = 'A' * 1000  # Try with 1000 characters
+        form = UnitForm(data={
+            'name': very_long_name,
             'company': self.company.pk
         })
-        self.assertEqual(response.status_code, 302)  # Should redirect on success
-        self.assertTrue(Unit.objects.filter(name=mixed_name).exists())
\ No newline at end of file
+        self.assertFalse(form.is_valid())
+        self.assertIn('Ensure this value has at most', form.errors['name'][0])
@@ -1,54 +1,60 @@
+from django.core.paginator import Paginator
 from django.shortcuts import render, get_object_or_404, redirect
+from django.views.decorators.cache import cache_page, never_cache
 from .models import Company, Unit, Employee
 from .forms import CompanyForm, UnitForm, EmployeeForm
 
+PAGE_SIZE = 40
+LIST_CACHE_TIMEOUT = 60
+
+def _edit_view(model, form_class, template_name, success_url):
+    """Build a view that creates a ``model`` instance, or edits it when ``pk`` is given."""
+    def edit(request, pk=None):
+        instance = get_object_or_404(model, pk=pk) if pk else None
+        if request.method == 'POST':
+            form = form_class(request.POST, instance=instance)
+            if form.is_valid():
+                form.save()
+                return redirect(success_url)
+        else:
+            form = form_class(instance=instance)
+        return render(request, template_name, {'form': form})
+    edit.__name__ = edit.__qualname__ = f'{model._meta.model_name}_edit'
+    return edit
+
 def home(request):
     return render(request, 'management/home.html')
 
 # Company Views
+@never_cache
+@cache_page(LIST_CACHE_TIMEOUT, cache='lists')
 def company_list(request):
-    companies = Company.objects.all()
-    return render(request, 'management/companies.html', {'companies': companies})
-
-def company_edit(request, pk=None):
-    company = get_object_or_404(Company, pk=pk) if pk else None
-    if request.method == 'POST':
-        form = CompanyForm(request.POST, instance=company)
-        if form.is_valid():
-            form.save()
-            return redirect('company_list')
-    else:
-        form = CompanyForm(instance=company)
-    return render(request, 'management/company_form.html', {'form': form})
+    companies = Company.objects.order_by('pk')
+    page_obj = Paginator(companies, PAGE_SIZE).get_page(request.GET.get('page'))
+    return render(request, 'management/companies.html', {'page_obj': page_obj})
+
+company_edit = _edit_view(Company, CompanyForm, 'management/company_form.html', 'company_list')
 
 # Unit Views
+@never_cache
+@cache_page(LIST_CACHE_TIMEOUT, cache='lists')
 def unit_list(request):
-    units = Unit.objects.all()
-    return render(request, 'management/units.html', {'units': units})
-
-def unit_edit(request, pk=None):
-    unit = get_object_or_404(Unit, pk=pk) if pk else None
-    if request.method == 'POST':
-        form = UnitForm(request.POST, instance=unit)
-        if form.is_valid():
-            form.save()
-            return redirect('unit_list')
-    else:
-        form = UnitForm(instance=unit)
-    return render(request, 'management/unit_form.html', {'form': form})
+    units = Unit.objects.only('name', 'company_name').order_by('pk')
+    page_obj = Paginator(units, PAGE_SIZE).get_page(request.GET.get('page'))
+    return render(request, 'management/units.html', {'page_obj': page_obj})
+
+unit_edit = _edit_view(Unit, UnitForm, 'management/unit_form.html', 'unit_list')
 
 # Employee Views
+@never_cache
+@cache_page(LIST_CACHE_TIMEOUT, cache='lists')
 def employee_list(request):
-    employees = Employee.objects.all()
-    return render(request, 'management/employees.html', {'employees': employees})
-
-def employee_edit(request, pk=None):
-    employee = get_object_or_404(Employee, pk=pk) if pk else None
-    if request.method == 'POST':
-        form = EmployeeForm(request.POST, instance=employee)
-        if form.is_valid():
-            form.save()
-            return redirect('employee_list')
-    else:
-        form = EmployeeForm(instance=employee)
-    return render(request, 'management/employee_form.html', {'form': form})
+    employees = (
+        Employee.objects.select_related('unit')
+        .only('first_name', 'last_name', 'email', 'unit__name')
+        .order_by('last_name', 'first_name', 'pk')
+    )
+    page_obj = Paginator(employees, PAGE_SIZE).get_page(request.GET.get('page'))
+    return render(request, 'management/employees.html', {'page_obj': page_obj})
+
+employee_edit = _edit_view(Employee, EmployeeForm, 'management/employee_form.html', 'employee_list')